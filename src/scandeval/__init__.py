@@ -1,10 +1,16 @@
 """ScandEval - A benchmarking framework for language models."""
 
 import importlib.metadata
+import importlib.util
 import logging
 import os
 import sys
 
+# Enable parallelised downloads from the Hugging Face Hub if `hf_transfer` is
+# installed. This has to be set before `huggingface_hub` is imported
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 from dotenv import load_dotenv
 from termcolor import colored
 
@@ -5,9 +5,12 @@ Taken from https://en.wikipedia.org/wiki/List_of_ISO_639-1_codes.
 Last updated 19 June 2022.
 """
 
+from functools import lru_cache
+
 from .config import Language
 
 
+@lru_cache(maxsize=None)
 def get_all_languages() -> dict[str, Language]:
     """Get a list of all the languages.
 
@@ -1,6 +1,8 @@
 """Model setup for fresh models."""
 
 import re
+from copy import deepcopy
+from functools import lru_cache
 from json import JSONDecodeError
 from typing import TYPE_CHECKING
 
@@ -31,6 +33,10 @@ if TYPE_CHECKING:
 FRESH_MODELS: list[str] = ["electra-small", "xlm-roberta-base"]
 
 
+# Matches the revision and the `fresh-` prefix of a fresh model ID
+FRESH_MODEL_ID_REGEX = re.compile(r"(@.*$|^fresh-)")
+
+
 class FreshModelSetup:
     """Model setup for fresh models.
 
@@ -50,7 +56,7 @@ class FreshModelSetup:
 
     @staticmethod
     def _strip_model_id(model_id: str) -> str:
-        return re.sub("(@.*$|^fresh-)", "", model_id)
+        return FRESH_MODEL_ID_REGEX.sub("", model_id)
 
     def model_exists(self, model_id: str) -> bool | dict[str, str]:
         """Check if a model ID denotes a fresh model.
@@ -135,13 +141,22 @@ class FreshModelSetup:
         else:
             raise InvalidModel(f"Model {model_id} is not supported as a fresh class.")
 
-        config = AutoConfig.from_pretrained(
-            model_id,
-            token=self.benchmark_config.token,
-            num_labels=dataset_config.num_labels,
-            id2label=dataset_config.id2label,
-            label2id=dataset_config.label2id,
-            cache_dir=model_config.model_cache_dir,
+        # Store the downloaded files in the same cache directory as the Hugging Face
+        # model setup uses for the pretrained model, so that the files are only
+        # downloaded once when benchmarking both the fresh and the pretrained model
+        hub_cache_dir = create_model_cache_dir(
+            cache_dir=self.benchmark_config.cache_dir, model_id=model_id
+        )
+
+        # The configuration is cached, so we copy it to avoid that modifications made
+        # to the model configuration affect later benchmarks
+        config = deepcopy(
+            _load_fresh_model_config(
+                model_id=model_id,
+                labels=tuple(dataset_config.task.labels),
+                token=self.benchmark_config.token,
+                cache_dir=hub_cache_dir,
+            )
         )
         model = model_cls(config)
 
@@ -153,14 +168,14 @@ class FreshModelSetup:
         prefix_models = ["Roberta", "GPT", "Deberta"]
         prefix = any(model_type in type(model).__name__ for model_type in prefix_models)
         try:
-            tokenizer: "PreTrainedTokenizerBase" = AutoTokenizer.from_pretrained(
-                model_id,
-                revision=model_config.revision,
-                token=self.benchmark_config.token,
-                add_prefix_space=prefix,
-                cache_dir=model_config.model_cache_dir,
-                use_fast=True,
-                verbose=False,
+            tokenizer: "PreTrainedTokenizerBase" = deepcopy(
+                _load_fresh_tokenizer(
+                    model_id=model_id,
+                    revision=model_config.revision,
+                    token=self.benchmark_config.token,
+                    add_prefix_space=prefix,
+                    cache_dir=hub_cache_dir,
+                )
             )
         except (JSONDecodeError, OSError):
             raise InvalidModel(f"Could not load tokenizer for model {model_id!r}.")
@@ -174,3 +189,72 @@ class FreshModelSetup:
         )
 
         return model, tokenizer
+
+
+@lru_cache(maxsize=8)
+def _load_fresh_model_config(
+    model_id: str, labels: tuple[str, ...], token: bool | str | None, cache_dir: str
+) -> "PretrainedConfig":
+    """Load the configuration of a fresh model.
+
+    The labels are passed as a tuple, so that they can be part of the cache key.
+
+    Args:
+        model_id:
+            The Hugging Face model ID.
+        labels:
+            The labels of the dataset.
+        token:
+            The authentication token for the Hugging Face Hub.
+        cache_dir:
+            The directory to cache the model files in.
+
+    Returns:
+        The model configuration.
+    """
+    return AutoConfig.from_pretrained(
+        model_id,
+        token=token,
+        num_labels=len(labels),
+        id2label={idx: label for idx, label in enumerate(labels)},
+        label2id={label: idx for idx, label in enumerate(labels)},
+        cache_dir=cache_dir,
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_fresh_tokenizer(
+    model_id: str,
+    revision: str,
+    token: bool | str | None,
+    add_prefix_space: bool,
+    cache_dir: str,
+) -> "PreTrainedTokenizerBase":
+    """Load the tokenizer of a fresh model.
+
+    The returned tokenizer is shared between calls, so callers should copy it.
+
+    Args:
+        model_id:
+            The Hugging Face model ID.
+        revision:
+            The revision of the model.
+        token:
+            The authentication token for the Hugging Face Hub.
+        add_prefix_space:
+            Whether to add a prefix space to the tokens.
+        cache_dir:
+            The directory to cache the model files in.
+
+    Returns:
+        The tokenizer.
+    """
+    return AutoTokenizer.from_pretrained(
+        model_id,
+        revision=revision,
+        token=token,
+        add_prefix_space=add_prefix_space,
+        cache_dir=cache_dir,
+        use_fast=True,
+        verbose=False,
+    )
@@ -1,14 +1,17 @@
 """Model setup for Hugging Face Hub models."""
 
 import importlib.util
+import json
 import logging
 import os
+from functools import lru_cache
 from json import JSONDecodeError
+from pathlib import Path
 from time import sleep
 from typing import TYPE_CHECKING, Type
 
 import torch
-from huggingface_hub import HfApi, ModelFilter
+from huggingface_hub import HfApi, ModelFilter, try_to_load_from_cache
 from huggingface_hub import whoami as hf_whoami
 from huggingface_hub.hf_api import RepositoryNotFoundError
 from huggingface_hub.utils import (
@@ -47,6 +50,7 @@ from ..vllm_models import VLLMModel
 from .utils import align_model_and_tokenizer, setup_model_for_question_answering
 
 if TYPE_CHECKING:
+    from huggingface_hub.hf_api import ModelInfo
     from transformers import PretrainedConfig, PreTrainedModel
 
     from ..config import BenchmarkConfig, DatasetConfig
@@ -56,6 +60,47 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__package__)
 
 
+MODEL_METADATA_FILENAME = "scandeval_model_metadata.json"
+
+
+@lru_cache(maxsize=None)
+def _get_hf_model_info(model_id: str, token: bool | str | None) -> "ModelInfo | None":
+    """Fetches the metadata of a model from the Hugging Face Hub.
+
+    Lookups are memoised for the rest of the run.
+
+    Args:
+        model_id:
+            The model ID of the model, without the revision.
+        token:
+            The authentication token for the Hugging Face Hub.
+
+    Returns:
+        The model metadata, or None if the model does not exist on the Hugging Face
+        Hub.
+    """
+    # Extract the author and model name from the model ID
+    author: str | None
+    if "/" in model_id:
+        author, model_name = model_id.split("/")
+    else:
+        author = None
+        model_name = model_id
+
+    api: HfApi = HfApi()
+    models = api.list_models(
+        filter=ModelFilter(author=author, model_name=model_name),
+        full=False,
+        token=token,
+    )
+
+    # Only keep the model with the specified model ID
+    for model in models:
+        if model.modelId == model_id:
+            return model
+    return None
+
+
 class HFModelSetup:
     """Model setup for Hugging Face Hub models.
 
@@ -88,11 +133,23 @@ class HFModelSetup:
             Whether the model exist, or a dictionary explaining why we cannot check
             whether the model exists.
         """
+        model_cache_dir = create_model_cache_dir(
+            cache_dir=self.benchmark_config.cache_dir, model_id=model_id
+        )
+
         # Extract the revision from the model_id, if present
         model_id, revision = (
             model_id.split("@") if "@" in model_id else (model_id, "main")
         )
 
+        # In offline mode the model can only be used if it has already been downloaded
+        if self._offline_mode_enabled():
+            if self._is_cached(
+                model_id=model_id, revision=revision, model_cache_dir=model_cache_dir
+            ):
+                return True
+            raise NoInternetConnection()
+
         # Connect to the Hugging Face Hub API
         hf_api = HfApi()
 
@@ -119,10 +176,15 @@ class HFModelSetup:
         except (RepositoryNotFoundError, HFValidationError):
             return False
 
-        # If fetching from the Hugging Face Hub failed in a different way then throw a
-        # reasonable exception
+        # If fetching from the Hugging Face Hub failed in a different way then we can
+        # still use the model if it has already been downloaded, and otherwise we throw
+        # a reasonable exception
         except OSError:
-            if internet_connection_available():
+            if self._is_cached(
+                model_id=model_id, revision=revision, model_cache_dir=model_cache_dir
+            ):
+                return True
+            elif internet_connection_available():
                 raise HuggingFaceHubDown()
             else:
                 raise NoInternetConnection()
@@ -144,48 +206,47 @@ class HFModelSetup:
             model_id_without_revision = model_id
             revision = "main"
 
-        # Extract the author and model name from the model ID
-        author: str | None
-        if "/" in model_id_without_revision:
-            author, model_name = model_id_without_revision.split("/")
-        else:
-            author = None
-            model_name = model_id_without_revision
+        model_cache_dir = create_model_cache_dir(
+            cache_dir=self.benchmark_config.cache_dir, model_id=model_id
+        )
+
+        # In offline mode the model configuration can only be built from the cache
+        if self._offline_mode_enabled():
+            cached_model_config = self._get_cached_model_config(
+                model_id=model_id_without_revision,
+                revision=revision,
+                model_cache_dir=model_cache_dir,
+            )
+            if cached_model_config is None:
+                raise NoInternetConnection()
+            return cached_model_config
 
         # Attempt to fetch model data from the Hugging Face Hub
         try:
-            api: HfApi = HfApi()
-
-            # Fetch the model metadata
-            models = api.list_models(
-                filter=ModelFilter(author=author, model_name=model_name),
-                token=self.benchmark_config.token,
+            model_info = _get_hf_model_info(
+                model_id=model_id_without_revision, token=self.benchmark_config.token
             )
 
-            # Filter the models to only keep the one with the specified model ID
-            models = [
-                model for model in models if model.modelId == model_id_without_revision
-            ]
-
             # Check that the model exists. If it does not then raise an error
-            if len(models) == 0:
+            if model_info is None:
                 raise InvalidModel(
                     f"The model {model_id} does not exist on the Hugging Face Hub."
                 )
 
-            tags: list[str] = models[0].tags
+            tags: list[str] = model_info.tags
+            tag_set = set(tags)
 
             framework = Framework.PYTORCH
-            if "pytorch" in tags:
+            if "pytorch" in tag_set:
                 pass
-            elif "jax" in tags:
+            elif "jax" in tag_set:
                 framework = Framework.JAX
-            elif "spacy" in tags:
+            elif "spacy" in tag_set:
                 raise InvalidModel("SpaCy models are not supported.")
-            elif "tf" in tags or "tensorflow" in tags or "keras" in tags:
+            elif "tf" in tag_set or "tensorflow" in tag_set or "keras" in tag_set:
                 raise InvalidModel("TensorFlow/Keras models are not supported.")
 
-            model_task: str | None = models[0].pipeline_tag
+            model_task: str | None = model_info.pipeline_tag
             if model_task is None:
                 generative_tags = [
                     "trl",
@@ -193,38 +254,166 @@ class HFModelSetup:
                     "text-generation-inference",
                     "unsloth",
                 ]
-                if any(tag in models[0].tags for tag in generative_tags):
+                if any(tag in tag_set for tag in generative_tags):
                     model_task = "text-generation"
                 else:
                     model_task = "fill-mask"
 
             language_mapping = get_all_languages()
-            language_codes = list(language_mapping.keys())
 
             model_config = ModelConfig(
-                model_id=models[0].modelId,
+                model_id=model_info.modelId,
                 framework=framework,
                 task=model_task,
                 languages=[
-                    language_mapping[tag] for tag in tags if tag in language_codes
+                    language_mapping[tag] for tag in tags if tag in language_mapping
                 ],
                 revision=revision,
                 model_type=ModelType.HF,
-                model_cache_dir=create_model_cache_dir(
-                    cache_dir=self.benchmark_config.cache_dir, model_id=model_id
-                ),
+                model_cache_dir=model_cache_dir,
             )
 
-        # If fetching from the Hugging Face Hub failed then throw a reasonable
-        # exception
+            # Store the metadata from the Hugging Face Hub alongside the model files,
+            # so that the model configuration can be built from the cache if the
+            # Hugging Face Hub cannot be reached later on
+            self._store_model_metadata(model_config=model_config)
+
+        # If fetching from the Hugging Face Hub failed then we build the model
+        # configuration from the cache if the model has already been downloaded, and
+        # otherwise we throw a reasonable exception
         except RequestException:
-            if internet_connection_available():
+            cached_model_config = self._get_cached_model_config(
+                model_id=model_id_without_revision,
+                revision=revision,
+                model_cache_dir=model_cache_dir,
+            )
+            if cached_model_config is not None:
+                return cached_model_config
+            elif internet_connection_available():
                 raise HuggingFaceHubDown()
             else:
                 raise NoInternetConnection()
 
         return model_config
 
+    def _offline_mode_enabled(self) -> bool:
+        """Check if offline mode has been enabled for the Hugging Face Hub.
+
+        Returns:
+            Whether the `HF_HUB_OFFLINE` environment variable has been set.
+        """
+        return os.getenv("HF_HUB_OFFLINE", "0") == "1"
+
+    def _is_cached(self, model_id: str, revision: str, model_cache_dir: str) -> bool:
+        """Check if a model has already been downloaded.
+
+        Args:
+            model_id:
+                The model ID of the model, without the revision.
+            revision:
+                The revision of the model.
+            model_cache_dir:
+                The directory in which the model files are cached.
+
+        Returns:
+            Whether the model configuration can be built from the cache.
+        """
+        cached_model_config = self._get_cached_model_config(
+            model_id=model_id, revision=revision, model_cache_dir=model_cache_dir
+        )
+        return cached_model_config is not None
+
+    def _store_model_metadata(self, model_config: ModelConfig) -> None:
+        """Stores the Hugging Face Hub metadata of a model in its cache directory.
+
+        Args:
+            model_config:
+                The model configuration, built from the Hugging Face Hub metadata.
+        """
+        metadata = dict(
+            task=model_config.task,
+            languages=[language.code for language in model_config.languages],
+        )
+        metadata_path = Path(model_config.model_cache_dir) / MODEL_METADATA_FILENAME
+        try:
+            metadata_path.parent.mkdir(parents=True, exist_ok=True)
+            metadata_path.write_text(json.dumps(metadata))
+        except OSError:
+            logger.debug(f"Could not store the model metadata at {metadata_path}.")
+
+    def _get_cached_model_config(
+        self, model_id: str, revision: str, model_cache_dir: str
+    ) -> ModelConfig | None:
+        """Builds the model configuration from locally cached model files.
+
+        This is only used when the Hugging Face Hub cannot be reached. It requires the
+        model configuration and weights to have been cached, as well as the Hugging
+        Face Hub metadata stored by `_store_model_metadata`, as the task of the model
+        cannot be reliably inferred from its configuration.
+
+        Args:
+            model_id:
+                The model ID of the model, without the revision.
+            revision:
+                The revision of the model.
+            model_cache_dir:
+                The directory in which the model files are cached.
+
+        Returns:
+            The model configuration, or None if the model has not been downloaded.
+        """
+        try:
+            metadata = json.loads(
+                (Path(model_cache_dir) / MODEL_METADATA_FILENAME).read_text()
+            )
+            task = metadata["task"]
+            language_codes = metadata["languages"]
+        except (JSONDecodeError, OSError, KeyError, TypeError):
+            return None
+
+        def cached_path(filename: str) -> str | None:
+            """Get the path to a cached model file, or None if it is not cached."""
+            path = try_to_load_from_cache(
+                repo_id=model_id,
+                filename=filename,
+                cache_dir=model_cache_dir,
+                revision=revision,
+            )
+            return path if isinstance(path, str) else None
+
+        if cached_path(filename="config.json") is None:
+            return None
+
+        # We can only determine the framework if the model weights have been cached
+        pytorch_weight_files = [
+            "model.safetensors",
+            "model.safetensors.index.json",
+            "pytorch_model.bin",
+            "pytorch_model.bin.index.json",
+        ]
+        if any(cached_path(filename=filename) for filename in pytorch_weight_files):
+            framework = Framework.PYTORCH
+        elif cached_path(filename="flax_model.msgpack") is not None:
+            framework = Framework.JAX
+        else:
+            return None
+
+        language_mapping = get_all_languages()
+
+        return ModelConfig(
+            model_id=model_id,
+            framework=framework,
+            task=task,
+            languages=[
+                language_mapping[code]
+                for code in language_codes
+                if code in language_mapping
+            ],
+            revision=revision,
+            model_type=ModelType.HF,
+            model_cache_dir=model_cache_dir,
+        )
+
     def load_model(
         self, model_config: ModelConfig, dataset_config: "DatasetConfig"
     ) -> tuple["PreTrainedModel | GenerativeModel", "Tokenizer"]:
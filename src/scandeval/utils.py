@@ -8,9 +8,11 @@ import os
 import random
 import re
 import sys
+import time
 import warnings
 from collections import defaultdict
-from copy import deepcopy
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Type
 
@@ -269,11 +271,29 @@ def kebab_to_pascal(kebab_string: str) -> str:
 def internet_connection_available() -> bool:
     """Checks if internet connection is available by pinging google.com.
 
+    The result is cached for up to 30 seconds, to avoid pinging google.com every time
+    this is called.
+
+    Returns:
+        Whether or not internet connection is available.
+    """
+    return _internet_connection_available(time_window=int(time.monotonic() // 30))
+
+
+@lru_cache(maxsize=1)
+def _internet_connection_available(time_window: int) -> bool:
+    """Checks if internet connection is available by pinging google.com.
+
+    Args:
+        time_window:
+            The current time window. This is only used as the cache key, so that the
+            cached result expires when the time window changes.
+
     Returns:
         Whether or not internet connection is available.
     """
     try:
-        requests.get("https://www.google.com")
+        requests.get("https://www.google.com", timeout=5)
         return True
     except RequestException:
         return False
@@ -336,6 +356,9 @@ def get_huggingface_model_lists(
 ) -> dict[str, list[str]]:
     """Fetches up-to-date model lists from the Hugging Face Hub.
 
+    The lists are cached, so that repeated calls with the same languages and token
+    only query the Hugging Face Hub once.
+
     Args:
         languages:
             The language codes of the language to consider. If None then the models
@@ -346,24 +369,65 @@ def get_huggingface_model_lists(
             the user has logged in through `huggingface-cli login`. If a string is
             specified then it will be used as the token.
 
+    Returns:
+        The keys are filterings of the list, which includes all language codes,
+        including 'multilingual', as well as 'all'. The values are lists of model IDs.
+    """
+    language_codes = (
+        None if languages is None else tuple(language.code for language in languages)
+    )
+    model_lists = _get_huggingface_model_lists(
+        language_codes=language_codes, token=token
+    )
+
+    # Copy the lists, to avoid callers modifying the cached lists
+    return {key: list(model_ids) for key, model_ids in model_lists.items()}
+
+
+@lru_cache(maxsize=None)
+def _get_huggingface_model_lists(
+    language_codes: tuple[str, ...] | None, token: bool | str | None
+) -> dict[str, list[str]]:
+    """Fetches up-to-date model lists from the Hugging Face Hub.
+
+    Args:
+        language_codes:
+            The language codes of the language to consider. If None then the models
+            will not be filtered on language.
+        token:
+            The authentication token for the Hugging Face Hub. If a boolean value is
+            specified then the token will be fetched from the Hugging Face CLI, where
+            the user has logged in through `huggingface-cli login`. If a string is
+            specified then it will be used as the token.
+
     Returns:
         The keys are filterings of the list, which includes all language codes,
         including 'multilingual', as well as 'all'. The values are lists of model IDs.
     """
     # Get list of all languages
-    all_languages = list(get_all_languages().values())
+    language_mapping = get_all_languages()
+    all_languages = list(language_mapping.values())
+
+    # Convert the language codes back to languages
+    languages = (
+        None
+        if language_codes is None
+        else [language_mapping[code] for code in language_codes]
+    )
 
     # If no languages are specified, then include all languages
     language_list = all_languages if languages is None else languages
 
+    # Check whether all languages have been requested
+    requested_codes = {lang.code for lang in language_list}
+    all_languages_requested = requested_codes == language_mapping.keys()
+
     # Form string of languages
     if len(language_list) == 1:
         language_string = language_list[0].name
     else:
         language_list = sorted(language_list, key=lambda x: x.name)
-        if {lang.code for lang in language_list} == {
-            lang.code for lang in all_languages
-        }:
+        if all_languages_requested:
             language_string = "all"
         else:
             # Remove generic 'Norwegian' from the list of languages if both 'Bokmål'
@@ -383,35 +447,37 @@ def get_huggingface_model_lists(
     api: HfApi = HfApi()
 
     # Initialise model lists
-    model_lists = defaultdict(list)
+    model_lists: defaultdict[str, set[str]] = defaultdict(set)
 
     # Do not iterate over all the languages if we are not filtering on language
     language_itr: list["Language | None"]
-    if {lang.code for lang in language_list} == {lang.code for lang in all_languages}:
+    if all_languages_requested:
         language_itr = [None]
     else:
-        language_itr = deepcopy(language_list)  # type: ignore[arg-type]
-
-    for language in language_itr:
-        # Extract the language code
-        language_str: str | None
-        if language is not None:
-            language_str = language.code
-        else:
-            language_str = None
-
-        # Fetch the model list
-        models: list["ModelInfo"] = list(
-            api.list_models(filter=ModelFilter(language=language_str), token=token)
+        language_itr = list(language_list)
+
+    def fetch_models(language: "Language | None") -> list["ModelInfo"]:
+        """Fetch the list of models for a language from the Hugging Face Hub."""
+        language_str = language.code if language is not None else None
+        return list(
+            api.list_models(
+                filter=ModelFilter(language=language_str), full=False, token=token
+            )
         )
 
-        # Filter the models to only keep the ones with the specified language
-        models = [
-            model
-            for model in models
-            if (language is None or language.code in model.tags)
+    # Fetch the model lists for all the languages concurrently, as the requests are
+    # I/O bound
+    with ThreadPoolExecutor(max_workers=min(16, len(language_itr))) as executor:
+        future_to_language = {
+            executor.submit(fetch_models, language): language
+            for language in language_itr
+        }
+        models_per_language: list[tuple["Language | None", list["ModelInfo"]]] = [
+            (future_to_language[future], future.result())
+            for future in as_completed(future_to_language)
         ]
 
+    for language, models in models_per_language:
         # Only keep the models which are not finetuned
         models = [
             model
@@ -431,9 +497,9 @@ def get_huggingface_model_lists(
         ]
 
         # Store the model IDs
-        model_lists["all"].extend(model_ids)
+        model_lists["all"].update(model_ids)
         if language is not None:
-            model_lists[language.code].extend(model_ids)
+            model_lists[language.code].update(model_ids)
 
     # Add multilingual models manually
     multi_models = [
@@ -465,13 +531,13 @@ def get_huggingface_model_lists(
         "dbmdz/bert-base-historic-multilingual-cased",
         "dbmdz/bert-medium-historic-multilingual-cased",
     ]
-    model_lists["multilingual"] = multi_models
-    model_lists["all"].extend(multi_models)
+    model_lists["multilingual"] = set(multi_models)
+    model_lists["all"].update(multi_models)
 
     # Add fresh models
     fresh_models = ["fresh-xlm-roberta-base", "fresh-electra-small"]
-    model_lists["fresh"].extend(fresh_models)
-    model_lists["all"].extend(fresh_models)
+    model_lists["fresh"].update(fresh_models)
+    model_lists["all"].update(fresh_models)
 
     # Add some multilingual Danish models manually that have not marked 'da' as their
     # language
@@ -484,15 +550,15 @@ def get_huggingface_model_lists(
             "Geotrend/distilbert-base-25lang-cased",
             "Geotrend/distilbert-base-en-fr-de-no-da-cased",
         ]
-        model_lists["da"].extend(multi_da_models)
-        model_lists["all"].extend(multi_da_models)
+        model_lists["da"].update(multi_da_models)
+        model_lists["all"].update(multi_da_models)
 
     # Add some multilingual Swedish models manually that have not marked 'sv' as their
     # language
     if SV in language_itr:
         multi_sv_models: list[str] = []
-        model_lists["sv"].extend(multi_sv_models)
-        model_lists["all"].extend(multi_sv_models)
+        model_lists["sv"].update(multi_sv_models)
+        model_lists["all"].update(multi_sv_models)
 
     # Add some multilingual Norwegian models manually that have not marked 'no', 'nb'
     # or 'nn' as their language
@@ -505,12 +571,8 @@ def get_huggingface_model_lists(
             "Geotrend/distilbert-base-25lang-cased",
             "Geotrend/distilbert-base-en-fr-de-no-da-cased",
         ]
-        model_lists["no"].extend(multi_no_models)
-        model_lists["all"].extend(multi_no_models)
-
-    # Remove duplicates from the lists
-    for lang, model_list in model_lists.items():
-        model_lists[lang] = list(set(model_list))
+        model_lists["no"].update(multi_no_models)
+        model_lists["all"].update(multi_no_models)
 
     # Remove banned models
     BANNED_MODELS = [
@@ -518,14 +580,14 @@ def get_huggingface_model_lists(
         r"M-CLIP/.*",
         r".*/.*CTRL.*",  # TEMP
     ]
-    for lang, model_list in model_lists.items():
-        model_lists[lang] = [
+    return {
+        lang: [
             model
-            for model in model_list
+            for model in model_set
             if not any(re.search(regex, model) is not None for regex in BANNED_MODELS)
         ]
-
-    return dict(model_lists)
+        for lang, model_set in model_lists.items()
+    }
 
 
 class HiddenPrints:
@@ -1,9 +1,17 @@
 """Create the MMLU-mini datasets and upload them to the HF Hub."""
 
+import importlib.util
+import os
+
+# Use `hf_transfer` for the dataset uploads, if it is installed
+if importlib.util.find_spec("hf_transfer") is not None:
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 
 import pandas as pd
-from datasets import Dataset, DatasetDict, Split, load_dataset
+from datasets import Dataset, DatasetDict, Split, concatenate_datasets, load_dataset
 from huggingface_hub import HfApi
 from requests import HTTPError
 from scripts.constants import (
@@ -18,9 +26,6 @@ from sklearn.model_selection import train_test_split
 
 def main() -> None:
     """Create the MMLU-mini datasets and upload them to the HF Hub."""
-    # Define the base download URL
-    repo_id = "alexandrainst/m_mmlu"
-
     # Create a mapping with the word "Choices" in different languages
     choices_mapping = {
         "da": "Svarmuligheder",
@@ -32,133 +37,163 @@ def main() -> None:
         "en": "Choices",
     }
 
-    for language in choices_mapping.keys():
-        # Download the dataset
-        try:
-            dataset = load_dataset(path=repo_id, name=language, token=True)
-        except ValueError as e:
-            if language == "no":
-                dataset = load_dataset(path=repo_id, name="nb", token=True)
-            else:
-                raise e
-        assert isinstance(dataset, DatasetDict)
-
-        # Convert the dataset to a dataframe
-        train_df = dataset["train"].to_pandas()
-        val_df = dataset["val"].to_pandas()
-        test_df = dataset["test"].to_pandas()
-        assert isinstance(train_df, pd.DataFrame)
-        assert isinstance(val_df, pd.DataFrame)
-        assert isinstance(test_df, pd.DataFrame)
-
-        # Concatenate the splits
-        df = pd.concat([train_df, val_df, test_df], ignore_index=True)
-
-        # Rename the columns
-        df.rename(columns=dict(answer="label"), inplace=True)
-
-        # Remove the samples with overly short or long texts
-        df = df[
-            (df.instruction.str.len() >= MIN_NUM_CHARS_IN_INSTRUCTION)
-            & (df.instruction.str.len() <= MAX_NUM_CHARS_IN_INSTRUCTION)
-            & (df.option_a.str.len() >= MIN_NUM_CHARS_IN_OPTION)
-            & (df.option_a.str.len() <= MAX_NUM_CHARS_IN_OPTION)
-            & (df.option_b.str.len() >= MIN_NUM_CHARS_IN_OPTION)
-            & (df.option_b.str.len() <= MAX_NUM_CHARS_IN_OPTION)
-            & (df.option_c.str.len() >= MIN_NUM_CHARS_IN_OPTION)
-            & (df.option_c.str.len() <= MAX_NUM_CHARS_IN_OPTION)
-            & (df.option_d.str.len() >= MIN_NUM_CHARS_IN_OPTION)
-            & (df.option_d.str.len() <= MAX_NUM_CHARS_IN_OPTION)
-        ]
-
-        def is_repetitive(text: str) -> bool:
-            """Return True if the text is repetitive."""
-            max_repetitions = max(Counter(text.split()).values())
-            return max_repetitions > MAX_REPETITIONS
-
-        # Remove overly repetitive samples
-        df = df[
-            ~df.instruction.apply(is_repetitive)
-            & ~df.option_a.apply(is_repetitive)
-            & ~df.option_b.apply(is_repetitive)
-            & ~df.option_c.apply(is_repetitive)
-            & ~df.option_d.apply(is_repetitive)
-        ]
-
-        # Extract the category as a column
-        df["category"] = df["id"].str.split("/").str[0]
-
-        # Make a `text` column with all the options in it
-        df["text"] = [
-            row.instruction.replace("\n", " ").strip() + "\n"
-            f"{choices_mapping[language]}:\n"
-            "a. " + row.option_a.replace("\n", " ").strip() + "\n"
-            "b. " + row.option_b.replace("\n", " ").strip() + "\n"
-            "c. " + row.option_c.replace("\n", " ").strip() + "\n"
-            "d. " + row.option_d.replace("\n", " ").strip()
-            for _, row in df.iterrows()
-        ]
-
-        # Make the `label` column case-consistent with the `text` column
-        df.label = df.label.str.lower()
-
-        # Only keep the `text`, `label` and `category` columns
-        df = df[["text", "label", "category"]]
-
-        # Remove duplicates
-        df.drop_duplicates(inplace=True)
-        df.reset_index(drop=True, inplace=True)
-
-        # Create validation split
-        val_size = 256
-        traintest_arr, val_arr = train_test_split(
-            df, test_size=val_size, random_state=4242, stratify=df.category
-        )
-        traintest_df = pd.DataFrame(traintest_arr, columns=df.columns)
-        val_df = pd.DataFrame(val_arr, columns=df.columns)
-
-        # Create test split
-        test_size = 2048
-        train_arr, test_arr = train_test_split(
-            traintest_df,
-            test_size=test_size,
-            random_state=4242,
-            stratify=traintest_df.category,
-        )
-        train_df = pd.DataFrame(train_arr, columns=df.columns)
-        test_df = pd.DataFrame(test_arr, columns=df.columns)
-
-        # Create train split
-        train_size = 1024
-        train_df = train_df.sample(train_size, random_state=4242)
-
-        # Reset the index
-        train_df = train_df.reset_index(drop=True)
-        val_df = val_df.reset_index(drop=True)
-        test_df = test_df.reset_index(drop=True)
-
-        # Collect datasets in a dataset dictionary
-        dataset = DatasetDict(
-            train=Dataset.from_pandas(train_df, split=Split.TRAIN),
-            val=Dataset.from_pandas(val_df, split=Split.VALIDATION),
-            test=Dataset.from_pandas(test_df, split=Split.TEST),
+    # Process the languages in parallel, as they are independent of each other
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(
+            executor.map(
+                process_language, choices_mapping.keys(), choices_mapping.values()
+            )
         )
 
-        # Create dataset ID
-        if language == "en":
-            dataset_id = "ScandEval/mmlu-mini"
-        else:
-            dataset_id = f"ScandEval/mmlu-{language}-mini"
 
-        # Remove the dataset from Hugging Face Hub if it already exists
-        try:
-            api = HfApi()
-            api.delete_repo(dataset_id, repo_type="dataset")
-        except HTTPError:
-            pass
+def process_language(language: str, choices_word: str) -> None:
+    """Create the MMLU-mini dataset for a language and upload it to the HF Hub.
+
+    Args:
+        language:
+            The language code of the dataset.
+        choices_word:
+            The word for "Choices" in the language.
+    """
+    # Define the base download URL
+    repo_id = "alexandrainst/m_mmlu"
 
-        # Push the dataset to the Hugging Face Hub
-        dataset.push_to_hub(dataset_id, private=True)
+    # Download the dataset
+    try:
+        dataset = load_dataset(path=repo_id, name=language, token=True)
+    except ValueError as e:
+        if language == "no":
+            dataset = load_dataset(path=repo_id, name="nb", token=True)
+        else:
+            raise e
+    assert isinstance(dataset, DatasetDict)
+
+    # Concatenate the splits and convert the result to a dataframe. The splits are
+    # concatenated as Arrow tables, so the data is only converted to pandas once
+    df = concatenate_datasets(
+        [dataset["train"], dataset["val"], dataset["test"]]
+    ).to_pandas()
+    assert isinstance(df, pd.DataFrame)
+
+    # Rename the columns
+    df.rename(columns=dict(answer="label"), inplace=True)
+
+    # Remove the samples with overly short or long texts
+    df = df[
+        (df.instruction.str.len() >= MIN_NUM_CHARS_IN_INSTRUCTION)
+        & (df.instruction.str.len() <= MAX_NUM_CHARS_IN_INSTRUCTION)
+        & (df.option_a.str.len() >= MIN_NUM_CHARS_IN_OPTION)
+        & (df.option_a.str.len() <= MAX_NUM_CHARS_IN_OPTION)
+        & (df.option_b.str.len() >= MIN_NUM_CHARS_IN_OPTION)
+        & (df.option_b.str.len() <= MAX_NUM_CHARS_IN_OPTION)
+        & (df.option_c.str.len() >= MIN_NUM_CHARS_IN_OPTION)
+        & (df.option_c.str.len() <= MAX_NUM_CHARS_IN_OPTION)
+        & (df.option_d.str.len() >= MIN_NUM_CHARS_IN_OPTION)
+        & (df.option_d.str.len() <= MAX_NUM_CHARS_IN_OPTION)
+    ]
+
+    def is_repetitive(text: str) -> bool:
+        """Return True if the text is repetitive."""
+        max_repetitions = max(Counter(text.split()).values())
+        return max_repetitions > MAX_REPETITIONS
+
+    # Remove overly repetitive samples
+    df = df[
+        ~df.instruction.apply(is_repetitive)
+        & ~df.option_a.apply(is_repetitive)
+        & ~df.option_b.apply(is_repetitive)
+        & ~df.option_c.apply(is_repetitive)
+        & ~df.option_d.apply(is_repetitive)
+    ]
+
+    # Extract the category as a column. This is stored as a categorical column, so
+    # that deduplication and stratification work on integer codes rather than
+    # strings
+    df["category"] = df["id"].str.split("/").str[0].astype("category")
+
+    def clean(column: str) -> pd.Series:
+        """Replace newlines with spaces and strip the values of a column."""
+        return df[column].str.replace("\n", " ", regex=False).str.strip()
+
+    # Make a `text` column with all the options in it
+    df["text"] = (
+        clean("instruction")
+        + f"\n{choices_word}:\n"
+        + "a. "
+        + clean("option_a")
+        + "\nb. "
+        + clean("option_b")
+        + "\nc. "
+        + clean("option_c")
+        + "\nd. "
+        + clean("option_d")
+    )
+
+    # Make the `label` column case-consistent with the `text` column
+    df.label = df.label.str.lower()
+
+    # Only keep the `text`, `label` and `category` columns
+    df = df[["text", "label", "category"]]
+
+    # Remove duplicates
+    df.drop_duplicates(inplace=True)
+    df.reset_index(drop=True, inplace=True)
+
+    # Create validation split
+    val_size = 256
+    traintest_idx, val_idx = train_test_split(
+        df.index, test_size=val_size, random_state=4242, stratify=df.category.cat.codes
+    )
+    traintest_df = df.loc[traintest_idx]
+    val_df = df.loc[val_idx]
+
+    # Create test split
+    test_size = 2048
+    train_idx, test_idx = train_test_split(
+        traintest_df.index,
+        test_size=test_size,
+        random_state=4242,
+        stratify=traintest_df.category.cat.codes,
+    )
+    train_df = traintest_df.loc[train_idx]
+    test_df = traintest_df.loc[test_idx]
+
+    # Create train split
+    train_size = 1024
+    train_df = train_df.sample(train_size, random_state=4242)
+
+    # Collect datasets in a dataset dictionary. The categories are converted back
+    # to strings, as `datasets` does not support categorical columns. We do not store
+    # the index, so there is no need to reset it
+    dataset = DatasetDict(
+        train=Dataset.from_pandas(
+            train_df.astype(dict(category=str)), split=Split.TRAIN, preserve_index=False
+        ),
+        val=Dataset.from_pandas(
+            val_df.astype(dict(category=str)),
+            split=Split.VALIDATION,
+            preserve_index=False,
+        ),
+        test=Dataset.from_pandas(
+            test_df.astype(dict(category=str)), split=Split.TEST, preserve_index=False
+        ),
+    )
+
+    # Create dataset ID
+    if language == "en":
+        dataset_id = "ScandEval/mmlu-mini"
+    else:
+        dataset_id = f"ScandEval/mmlu-{language}-mini"
+
+    # Remove the dataset from Hugging Face Hub if it already exists
+    try:
+        api = HfApi()
+        api.delete_repo(dataset_id, repo_type="dataset")
+    except HTTPError:
+        pass
+
+    # Push the dataset to the Hugging Face Hub
+    dataset.push_to_hub(dataset_id, private=True)
 
 
 if __name__ == "__main__":
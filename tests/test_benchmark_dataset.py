@@ -1 +1,64 @@
 """Unit tests for the `benchmark_dataset` module."""
+
+from copy import deepcopy
+from typing import Generator
+
+import numpy as np
+import pytest
+from datasets import config as datasets_config
+from scandeval import benchmark_dataset
+from scandeval.benchmark_dataset import BenchmarkDataset, datasets_offline_mode
+from scandeval.dataset_configs import ANGRY_TWEETS_CONFIG
+from scandeval.dataset_factory import DatasetFactory
+from scandeval.exceptions import NoInternetConnection
+
+
+@pytest.fixture
+def dataset(benchmark_config, tmp_path) -> Generator[BenchmarkDataset, None, None]:
+    """Yields a benchmark dataset with an empty cache directory."""
+    benchmark_config_copy = deepcopy(benchmark_config)
+    benchmark_config_copy.cache_dir = str(tmp_path)
+    yield DatasetFactory(benchmark_config_copy).build_dataset(
+        dataset=ANGRY_TWEETS_CONFIG
+    )
+
+
+def disconnect(monkeypatch) -> None:
+    """Make the HF Hub unreachable for `datasets`, unless it is in offline mode."""
+    load_dataset = benchmark_dataset.load_dataset
+
+    def load_dataset_without_internet(*args, **kwargs):
+        if not datasets_config.HF_DATASETS_OFFLINE:
+            raise ConnectionError("Couldn't reach the Hugging Face Hub.")
+        return load_dataset(*args, **kwargs)
+
+    monkeypatch.setattr(
+        benchmark_dataset, "load_dataset", load_dataset_without_internet
+    )
+    monkeypatch.setattr(
+        benchmark_dataset, "internet_connection_available", lambda: False
+    )
+
+
+def test_datasets_offline_mode_is_restored():
+    """Test that the offline mode of `datasets` is only enabled temporarily."""
+    datasets_offline = datasets_config.HF_DATASETS_OFFLINE
+    with datasets_offline_mode():
+        assert datasets_config.HF_DATASETS_OFFLINE
+    assert datasets_config.HF_DATASETS_OFFLINE == datasets_offline
+
+
+def test_load_cached_data_without_internet_connection(dataset, monkeypatch):
+    """Test that a cached dataset is loaded when there is no internet connection."""
+    train, val, _ = dataset._load_data(rng=np.random.default_rng(4242))
+    disconnect(monkeypatch=monkeypatch)
+    offline_train, offline_val, _ = dataset._load_data(rng=np.random.default_rng(4242))
+    assert offline_train.to_dict() == train.to_dict()
+    assert offline_val.to_dict() == val.to_dict()
+
+
+def test_load_uncached_data_without_internet_connection(dataset, monkeypatch):
+    """Test that loading an uncached dataset offline raises NoInternetConnection."""
+    disconnect(monkeypatch=monkeypatch)
+    with pytest.raises(NoInternetConnection):
+        dataset._load_data(rng=np.random.default_rng(4242))
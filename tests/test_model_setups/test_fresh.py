@@ -1 +1,18 @@
 """Unit tests for the `model_setups.fresh` module."""
+
+import pytest
+from scandeval.model_setups.fresh import FreshModelSetup
+
+
+@pytest.mark.parametrize(
+    argnames=["model_id", "expected"],
+    argvalues=[
+        ("fresh-xlm-roberta-base", "xlm-roberta-base"),
+        ("fresh-electra-small@main", "electra-small"),
+        ("electra-small", "electra-small"),
+    ],
+    ids=["with-prefix", "with-prefix-and-revision", "without-prefix"],
+)
+def test_strip_model_id(model_id, expected):
+    """Test that the fresh prefix and the revision are stripped from a model ID."""
+    assert FreshModelSetup._strip_model_id(model_id=model_id) == expected
@@ -4,7 +4,10 @@ import copy
 
 import pytest
 import torch
+from huggingface_hub import snapshot_download
+from scandeval.exceptions import NoInternetConnection
 from scandeval.model_setups.hf import HFModelSetup
+from scandeval.utils import GENERATIVE_MODEL_TASKS
 
 
 @pytest.mark.parametrize(
@@ -54,3 +57,56 @@ def test_torch_dtype_is_set_correctly(
         model_cache_dir=benchmark_config_copy.cache_dir,
     )
     assert model_setup._get_torch_dtype(config=hf_model_config) == expected
+
+
+def test_cached_model_config_keeps_hub_task(benchmark_config, tmp_path):
+    """Test that the model task from the Hugging Face Hub is used on a cache hit."""
+    benchmark_config_copy = copy.deepcopy(benchmark_config)
+    benchmark_config_copy.cache_dir = str(tmp_path)
+    model_setup = HFModelSetup(benchmark_config=benchmark_config_copy)
+
+    # ELECTRA is in the causal language modelling mapping of `transformers`, so the
+    # task cannot be inferred from the model type
+    model_id = "jonfd/electra-small-nordic"
+    model_config = model_setup.get_model_config(model_id=model_id)
+    assert model_config.task not in GENERATIVE_MODEL_TASKS
+
+    snapshot_download(
+        repo_id=model_id,
+        cache_dir=model_config.model_cache_dir,
+        allow_patterns=["config.json", "pytorch_model.bin", "model.safetensors"],
+    )
+    cached_model_config = model_setup._get_cached_model_config(
+        model_id=model_id,
+        revision=model_config.revision,
+        model_cache_dir=model_config.model_cache_dir,
+    )
+    assert cached_model_config is not None
+    assert cached_model_config.task == model_config.task
+    assert cached_model_config.languages == model_config.languages
+
+
+def test_offline_mode_uses_cached_model(benchmark_config, tmp_path, monkeypatch):
+    """Test that only cached models can be used in offline mode."""
+    benchmark_config_copy = copy.deepcopy(benchmark_config)
+    benchmark_config_copy.cache_dir = str(tmp_path)
+    model_setup = HFModelSetup(benchmark_config=benchmark_config_copy)
+    model_id = "jonfd/electra-small-nordic"
+
+    monkeypatch.setenv("HF_HUB_OFFLINE", "1")
+    with pytest.raises(NoInternetConnection):
+        model_setup.model_exists(model_id=model_id)
+    with pytest.raises(NoInternetConnection):
+        model_setup.get_model_config(model_id=model_id)
+
+    monkeypatch.delenv("HF_HUB_OFFLINE")
+    model_config = model_setup.get_model_config(model_id=model_id)
+    snapshot_download(
+        repo_id=model_id,
+        cache_dir=model_config.model_cache_dir,
+        allow_patterns=["config.json", "pytorch_model.bin", "model.safetensors"],
+    )
+
+    monkeypatch.setenv("HF_HUB_OFFLINE", "1")
+    assert model_setup.model_exists(model_id=model_id) is True
+    assert model_setup.get_model_config(model_id=model_id) == model_config
@@ -6,9 +6,11 @@ import numpy as np
 import pytest
 import torch
 from scandeval.utils import (
+    _internet_connection_available,
     convert_prompt_to_instruction,
     enforce_reproducibility,
     get_end_of_chat_token_ids,
+    internet_connection_available,
     is_module_installed,
     should_prefix_space_be_added_to_labels,
     should_prompts_be_stripped,
@@ -72,6 +74,23 @@ def test_module_is_installed(module_name, expected):
     assert is_module_installed(module_name) == expected
 
 
+def test_internet_connection_available_is_cached():
+    """Test that the internet connection check is cached within a time window."""
+    _internet_connection_available.cache_clear()
+    assert isinstance(internet_connection_available(), bool)
+
+    _internet_connection_available.cache_clear()
+    first_result = _internet_connection_available(time_window=0)
+    second_result = _internet_connection_available(time_window=0)
+    assert first_result == second_result
+    assert _internet_connection_available.cache_info().misses == 1
+    assert _internet_connection_available.cache_info().hits == 1
+
+    # A new time window has to check the internet connection again
+    _internet_connection_available(time_window=1)
+    assert _internet_connection_available.cache_info().misses == 2
+
+
 @pytest.mark.parametrize(
     argnames=["model_id", "expected"],
     argvalues=[